@@ -3,19 +3,24 @@
 Geo Profile Generator CLI
 
 This script generates realistic fictional profiles with geographical data.
-It offers command-line options to customize the output and can export to CSV, Excel, or JSON.
+It offers command-line options to customize the output and can export to CSV, Excel, JSON, NDJSON, or Parquet.
 """
 
 import argparse
+import csv
+import functools
 import json
+import multiprocessing
 import os
-import random
 import sys
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Union
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 from faker import Faker
+from faker.providers import BaseProvider
 import openpyxl
 
 # Try to import optional dependencies
@@ -32,6 +37,193 @@ try:
 except ImportError:
     EXCEL_AVAILABLE = False
 
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Number of Faker values sampled once and reused for city and street names
+FAKER_POOL_SIZE = 5000
+
+# Maximum number of rows in an Excel worksheet, including the header
+EXCEL_MAX_ROWS = 1_048_576
+
+# Rows per chunk when writing CSV with pandas
+CSV_CHUNK_SIZE = 50_000
+
+
+def _years_before(day: date, years: int) -> date:
+    """
+    Get the calendar date a number of years before a given date.
+    
+    Args:
+        day: Reference date.
+        years: Number of years to go back.
+    
+    Returns:
+        The same day and month `years` earlier, with Feb 29 mapped to Feb 28.
+    """
+    try:
+        return day.replace(year=day.year - years)
+    except ValueError:
+        return day.replace(year=day.year - years, day=28)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_faker(locale: str) -> Faker:
+    """
+    Get a Faker instance for a locale, shared by all generators.
+    
+    Args:
+        locale: Locale for generating region-specific data.
+    
+    Returns:
+        A cached Faker instance.
+    """
+    return Faker(locale)
+
+
+def _fast_random_element(self, elements=("a", "b", "c")):
+    """
+    Pick a random element uniformly, caching the keys of OrderedDict elements.
+    
+    Args:
+        elements: Sequence or OrderedDict to sample from.
+    
+    Returns:
+        A randomly selected element.
+    """
+    if isinstance(elements, dict):
+        if not hasattr(elements, "_key_cache"):
+            elements._key_cache = tuple(elements.keys())
+        elements = elements._key_cache
+    elif not isinstance(elements, (list, tuple, str)):
+        elements = tuple(elements)
+    return self.generator.random.choice(elements)
+
+
+# Faker's random_element honours OrderedDict weights at a high per-call cost;
+# sample uniformly instead unless weighted sampling is requested
+if not os.environ.get("GEO_PROFILE_WEIGHTED_FAKER"):
+    BaseProvider.random_element = _fast_random_element
+
+
+def _purchase_kernel(prices, quantities, tax_rates, out_subtotal, out_tax, out_total):
+    """
+    Compute rounded subtotal, tax amount and total for each purchase in place.
+    
+    Args:
+        prices: Item prices.
+        quantities: Item quantities.
+        tax_rates: Sales tax rates.
+        out_subtotal: Output array for subtotals.
+        out_tax: Output array for tax amounts.
+        out_total: Output array for totals.
+    """
+    for i in prange(prices.shape[0]):
+        subtotal = prices[i] * quantities[i]
+        tax_amount = round(subtotal * tax_rates[i], 2)
+        out_subtotal[i] = round(subtotal, 2)
+        out_tax[i] = tax_amount
+        out_total[i] = round(subtotal + tax_amount, 2)
+
+
+if NUMBA_AVAILABLE:
+    _purchase_kernel = njit(
+        "void(f8[:], i8[:], f8[:], f8[:], f8[:], f8[:])", parallel=True, cache=True
+    )(_purchase_kernel)
+
+
+def calculate_purchase_totals(
+    prices: np.ndarray, quantities: np.ndarray, tax_rates: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculate rounded purchase totals for a batch of purchases.
+    
+    Args:
+        prices: Item prices.
+        quantities: Item quantities.
+        tax_rates: Sales tax rates.
+    
+    Returns:
+        A tuple of (subtotal, tax_amount, total) arrays.
+    """
+    if not NUMBA_AVAILABLE:
+        # Fall back to plain NumPy arithmetic
+        subtotal = prices * quantities
+        tax_amount = np.round(subtotal * tax_rates, 2)
+        return np.round(subtotal, 2), tax_amount, np.round(subtotal + tax_amount, 2)
+    
+    subtotal = np.empty(prices.shape[0])
+    tax_amount = np.empty(prices.shape[0])
+    total = np.empty(prices.shape[0])
+    _purchase_kernel(
+        np.ascontiguousarray(prices, dtype=np.float64),
+        np.ascontiguousarray(quantities, dtype=np.int64),
+        np.ascontiguousarray(tax_rates, dtype=np.float64),
+        subtotal, tax_amount, total
+    )
+    return subtotal, tax_amount, total
+
+
+def _generate_profiles_worker(args: Tuple[int, str, Optional[int]]) -> pd.DataFrame:
+    """
+    Generate a shard of profiles in a worker process.
+    
+    Args:
+        args: Tuple of (count, locale, seed) for the shard.
+    
+    Returns:
+        A pandas DataFrame with the shard's profiles.
+    """
+    count, locale, seed = args
+    return GeoProfileGenerator(locale=locale, seed=seed).generate_frame(count)
+
+
+class Profile(NamedTuple):
+    """A single fictional profile with purchase details."""
+    
+    first_name: str
+    last_name: str
+    gender: str
+    email: str
+    birthday: str
+    street: str
+    zip_city: str
+    state: str
+    latitude: float
+    longitude: float
+    purchase_item: str
+    price: float
+    quantity: int
+    tax_rate: float
+    tax_amount: float
+    subtotal: float
+    total: float
+    purchase_type: str
+    purchase_date: str
+
 
 class GeoProfileGenerator:
     """Generator for fictional profiles with geographical data."""
@@ -44,19 +236,22 @@ class GeoProfileGenerator:
             locale: Locale for generating region-specific data.
             seed: Random seed for reproducibility.
         """
-        self.faker = Faker(locale)
+        self.faker = _get_faker(locale)
+        self.locale = locale
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        self._faker_pools: Dict[str, np.ndarray] = {}
         
         # Set seed if provided
         if seed is not None:
             Faker.seed(seed)
-            random.seed(seed)
             
         # Define German states
-        self.states = [
+        self.states = np.array([
             "Baden-Württemberg", "Bayern", "Berlin", "Brandenburg", "Bremen", "Hamburg", "Hessen", 
             "Niedersachsen", "Mecklenburg-Vorpommern", "Nordrhein-Westfalen", "Rheinland-Pfalz", 
             "Saarland", "Sachsen", "Sachsen-Anhalt", "Schleswig-Holstein", "Thüringen"
-        ]
+        ], dtype=object)
         
         # Define ZIP code ranges for each state
         self.zip_code_ranges = {
@@ -81,8 +276,21 @@ class GeoProfileGenerator:
             "Thüringen": (99000, 99999)
         }
         
+        # Index ZIP code ranges by state ordinal; states with a single range
+        # repeat it as their alternative range
+        self._state_to_idx = {state: i for i, state in enumerate(self.states)}
+        self._zip_lo = np.zeros((2, len(self.states)), dtype=np.int32)
+        self._zip_hi = np.zeros((2, len(self.states)), dtype=np.int32)
+        for state, i in self._state_to_idx.items():
+            zip_ranges = self.zip_code_ranges[state]
+            if isinstance(zip_ranges, tuple):
+                zip_ranges = [zip_ranges, zip_ranges]
+            for j, (lo, hi) in enumerate(zip_ranges):
+                self._zip_lo[j, i] = int(lo)
+                self._zip_hi[j, i] = int(hi)
+        
         # Define first names and last names
-        self.first_names_male = [
+        self.first_names_male = np.array([
             "Lukas", "Max", "Paul", "Jonas", "Leon", "Felix", "Finn", "Ben", "Moritz", 
             "Noah", "Johannes", "Tim", "Julian", "David", "Matthias", "Niklas", "Elias", 
             "Alexander", "Tobias", "Samuel", "Lucas", "Jakob", "Fabian", "Andreas", 
@@ -90,9 +298,9 @@ class GeoProfileGenerator:
             "Johann", "Mark", "Kai", "Martin", "Jakob", "Julian", "Tom", "Nico", 
             "Patrick", "Sebastian", "Bastian", "Hannes", "Matthias", "Rafael", "Georg", 
             "Arthur", "Lennard", "Oskar", "Jan", "Maurice", "Timothy"
-        ]
+        ], dtype=object)
         
-        self.first_names_female = [
+        self.first_names_female = np.array([
             "Anna", "Sophie", "Marie", "Emma", "Lena", "Laura", "Mia", "Hannah", "Lina", 
             "Sophie", "Lea", "Sarah", "Charlotte", "Clara", "Amelie", "Lilli", "Emily", 
             "Nina", "Ella", "Katharina", "Isabella", "Julia", "Lisa", "Franziska", 
@@ -100,9 +308,9 @@ class GeoProfileGenerator:
             "Lara", "Alina", "Klara", "Victoria", "Elena", "Sina", "Merle", "Maja", 
             "Selina", "Antonia", "Tessa", "Nadine", "Isabel", "Vanessa", "Daniela", 
             "Verena", "Bettina", "Jana", "Maike", "Melanie"
-        ]
+        ], dtype=object)
         
-        self.last_names = [
+        self.last_names = np.array([
             "Müller", "Schmidt", "Schneider", "Fischer", "Weber", "Meyer", "Wagner", "Becker", 
             "Hoffmann", "Schulz", "Bauer", "Koch", "Richter", "Klein", "Wolf", "Schröder", 
             "Neumann", "Schwarz", "Zimmermann", "Braun", "Schmitt", "Hartmann", "Lange", "Werner", 
@@ -110,10 +318,18 @@ class GeoProfileGenerator:
             "Böhm", "Weiss", "Bergmann", "Kraus", "Vogel", "Lang", "Ziegler", "Sauer", 
             "Weidner", "Meyerhoff", "Weigel", "Weber", "Wirth", "Krämer", "Röder", "Heinrich", 
             "Hahn", "Böttcher", "Schulze"
-        ]
+        ], dtype=object)
+        
+        # Precompute lowercase names and initials for email usernames
+        self._male_lower = np.array([name.lower() for name in self.first_names_male])
+        self._female_lower = np.array([name.lower() for name in self.first_names_female])
+        self._last_lower = np.array([name.lower() for name in self.last_names])
+        self._male_init = self._male_lower.astype("<U1")
+        self._female_init = self._female_lower.astype("<U1")
+        self._last_init = self._last_lower.astype("<U1")
         
         # Define common German email providers
-        self.email_providers = [
+        self.email_providers = np.array([
             "gmx.de", "web.de", "t-online.de", "yahoo.de", "freenet.de", "aol.de", "mail.de", 
             "tutanota.de", "hotmail.de", "outlook.de", "1und1.de", "posteo.de", "googlemail.com", 
             "mailbox.org", "arcor.de", "ziggo.de", "gmx.net", "freemail.de", "scholar.de", 
@@ -123,7 +339,7 @@ class GeoProfileGenerator:
             "gmx.org", "sapo.de", "mail.ru", "scout24.de", "onlinedeutsch.de", "blitzmail.de", 
             "earthlink.net", "easy-mail.de", "eclipso.de", "freenetmail.de", "mailzilla.de", 
             "surfmail.de", "gmx.us", "altavista.com", "dawnmail.de", "posteo.net"
-        ]
+        ], dtype=object)
         
         # Define city coordinates
         self.city_coords = {
@@ -152,9 +368,11 @@ class GeoProfileGenerator:
             "Nürnberg": (49.4521, 11.0767),
             # Add more cities as needed
         }
+        self._city_lat = pd.Series({city: coords[0] for city, coords in self.city_coords.items()})
+        self._city_lon = pd.Series({city: coords[1] for city, coords in self.city_coords.items()})
         
         # Define purchase items
-        self.purchase_items = [
+        self.purchase_items = np.array([
             "Hose", "T-Shirt", "Socken", "Jacke", "Schuhe", "Kleid", "Bluse", "Rock", "Pullover",
             "Jeans", "Shorts", "Mantel", "Anzug", "Mütze", "Schal", "Handschuhe", "Unterwäsche", 
             "Badeanzug", "Jogginghose", "Hemd", "Polo-Shirt", "Top", "Pyjama", "Bikini", "Weste", 
@@ -167,7 +385,25 @@ class GeoProfileGenerator:
             "Abendkleid", "Ballkleid", "Ballerinas", "Mokassins", "Zehensandalen", "Bastschuhe", "Segelschuhe", 
             "Wedges", "Plateauschuhe", "Stoffschuhe", "Clogs", "Römersandalen", "Kampfstiefel", "Chelseaboots", 
             "Brogues", "Halbschuhe", "Oxfordschuhe", "Laufschuhe", "Kletterhosen", "Sport-BH", "Funktionsshirt"
-        ]
+        ], dtype=object)
+        
+        # Define purchase types
+        self.purchase_types = np.array(["Online", "In-Store"], dtype=object)
+        
+        # Define genders
+        self.genders = np.array(["male", "female"], dtype=object)
+
+    def _choice(self, elements):
+        """
+        Pick a random element from a sequence using the generator's RNG.
+        
+        Args:
+            elements: Sequence to choose from.
+        
+        Returns:
+            A randomly selected element.
+        """
+        return elements[self.rng.integers(len(elements))]
 
     def generate_zip_code(self, state: str) -> str:
         """
@@ -185,11 +421,11 @@ class GeoProfileGenerator:
         # If the state is Sachsen (Saxony) and has multiple ranges, we handle it differently
         if state == "Sachsen":
             # Randomly select one of the ranges for Sachsen
-            zip_range = random.choice(zip_range)
+            zip_range = self._choice(zip_range)
             
         # Generate a random ZIP code within the range
         if isinstance(zip_range, tuple):
-            return str(random.randint(int(zip_range[0]), int(zip_range[1])))
+            return f"{self.rng.integers(int(zip_range[0]), int(zip_range[1]) + 1):05d}"
         else:
             return zip_range  # If it's already a string range
 
@@ -222,22 +458,36 @@ class GeoProfileGenerator:
             A synthetic email address.
         """
         # Choose a random email provider
-        email_provider = random.choice(self.email_providers)
+        email_provider = self._choice(self.email_providers)
         
         # Create a username with optional formatting variations
-        format_type = random.randint(1, 4)
+        format_type = self.rng.integers(1, 5)
+        username = self._format_username(first_name, last_name, format_type, self.rng.integers(1, 101))
+            
+        # Return the full email address
+        return f"{username}@{email_provider}"
+
+    def _format_username(self, first_name: str, last_name: str, format_type: int, number: int) -> str:
+        """
+        Build an email username according to one of four formatting variations.
         
+        Args:
+            first_name: Person's first name.
+            last_name: Person's last name.
+            format_type: Formatting variation (1-4).
+            number: Numeric suffix for the username.
+        
+        Returns:
+            The email username.
+        """
         if format_type == 1:
-            username = f"{first_name.lower()}.{last_name.lower()}{random.randint(1, 100)}"
+            return f"{first_name.lower()}.{last_name.lower()}{number}"
         elif format_type == 2:
-            username = f"{first_name.lower()[0]}{last_name.lower()}{random.randint(1, 100)}"
+            return f"{first_name.lower()[0]}{last_name.lower()}{number}"
         elif format_type == 3:
-            username = f"{first_name.lower()}{last_name.lower()[0]}{random.randint(1, 100)}"
+            return f"{first_name.lower()}{last_name.lower()[0]}{number}"
         else:
-            username = f"{last_name.lower()}.{first_name.lower()}{random.randint(1, 100)}"
-            
-        # Return the full email address
-        return f"{username}@{email_provider}"
+            return f"{last_name.lower()}.{first_name.lower()}{number}"
 
     def generate_address(self, state: str) -> Tuple[str, str]:
         """
@@ -251,11 +501,26 @@ class GeoProfileGenerator:
         """
         # Generate a random ZIP code based on the state
         zip_code = self.generate_zip_code(state)
-        city = self.faker.city()
-        street = f"{self.faker.street_name()} {self.faker.building_number()}"
+        city = self._choice(self._faker_pool("city"))
+        street = f"{self._choice(self._faker_pool('street_name'))} {self.rng.integers(1, 301)}"
         
         return f"{zip_code} {city}", street
 
+    def _faker_pool(self, field: str) -> np.ndarray:
+        """
+        Get a cached pool of Faker values for a field, sampling it on first use.
+        
+        Args:
+            field: Name of the Faker method, e.g. 'city'.
+        
+        Returns:
+            An array of FAKER_POOL_SIZE generated values.
+        """
+        if field not in self._faker_pools:
+            generate = getattr(self.faker, field)
+            self._faker_pools[field] = np.array([generate() for _ in range(FAKER_POOL_SIZE)], dtype=object)
+        return self._faker_pools[field]
+
     def generate_birthday(self, min_age: int = 18, max_age: int = 80) -> str:
         """
         Generate a random birthday within the specified age range.
@@ -277,223 +542,467 @@ class GeoProfileGenerator:
         return birth_date.strftime("%Y-%m-%d")
     
     def generate_price(self) -> float:
-      """
-      Generate a random price for a purchase item.
-      
-      Returns:
-          A float representing the price in Euro.
-      """
-    # Generate a price between 5 and 199.99 Euro
-      price = round(random.uniform(5.0, 199.99), 2)
-      return price
-
-def generate_stueckzahl(self) -> int:
-    """
-    Generate a random quantity for a purchase.
-    
-    Returns:
-        An integer representing the quantity.
-    """
-    # Most common case: quantity of 1
-    if random.random() < 0.7:
-        return 1
-    else:
-        # Sometimes buy multiple items (2-5)
-        return random.randint(2, 5)
+        """
+        Generate a random price for a purchase item.
+        
+        Returns:
+            A float representing the price in Euro.
+        """
+        # Generate a price between 5 and 199.99 Euro
+        price = round(self.rng.uniform(5.0, 199.99), 2)
+        return price
 
-def generate_sales_tax(self) -> float:
-    """
-    Generate sales tax rate.
-    
-    Returns:
-        A float representing the tax rate (0.19 or 0.07).
-    """
-    # Standard rate (19%) or reduced rate (7%)
-    return 0.19 if random.random() < 0.8 else 0.07
+    def generate_frame(self, count: int = 10) -> pd.DataFrame:
+        """
+        Generate multiple profiles as a DataFrame, drawing each field for all rows at once.
+        
+        Args:
+            count: Number of profiles to generate.
+        
+        Returns:
+            A pandas DataFrame with all profiles.
+        """
+        rng = self.rng
+        
+        # Draw the uniforms for the gender, quantity, tax and email format
+        # branches in one call, one contiguous row per field
+        gender_u, quantity_u, tax_u, format_u = rng.random((4, count))
+        
+        # Generate gender and names
+        is_male = gender_u < 0.5
+        male_idx = rng.integers(0, len(self.first_names_male), count)
+        female_idx = rng.integers(0, len(self.first_names_female), count)
+        last_idx = rng.integers(0, len(self.last_names), count)
+        gender = pd.Categorical.from_codes((~is_male).astype(np.int8), categories=self.genders)
+        first_name = np.where(is_male, self.first_names_male[male_idx], self.first_names_female[female_idx])
+        last_name = self.last_names[last_idx]
+        
+        # Generate email
+        provider_idx = rng.integers(0, len(self.email_providers), count)
+        format_type = (format_u * 4).astype(np.int64) + 1
+        email_number = rng.integers(1, 101, count)
+        first_lower = np.where(is_male, self._male_lower[male_idx], self._female_lower[female_idx])
+        first_initial = np.where(is_male, self._male_init[male_idx], self._female_init[female_idx])
+        last_lower = self._last_lower[last_idx]
+        last_initial = self._last_init[last_idx]
+        number = email_number.astype(str)
+        username = np.choose(format_type - 1, [
+            np.char.add(np.char.add(np.char.add(first_lower, "."), last_lower), number),
+            np.char.add(np.char.add(first_initial, last_lower), number),
+            np.char.add(np.char.add(first_lower, last_initial), number),
+            np.char.add(np.char.add(np.char.add(last_lower, "."), first_lower), number)
+        ])
+        providers = self.email_providers[provider_idx].astype(str)
+        email = np.char.add(np.char.add(username, "@"), providers).astype(object)
+        
+        # Generate state and address
+        state_idx = rng.integers(0, len(self.states), count)
+        state = pd.Categorical.from_codes(state_idx, categories=self.states)
+        zip_range_idx = rng.integers(0, 2, count)
+        zip_lo = self._zip_lo[zip_range_idx, state_idx]
+        zip_hi = self._zip_hi[zip_range_idx, state_idx]
+        zip_code = np.char.mod("%05d", zip_lo + rng.integers(0, zip_hi - zip_lo + 1)).astype(object)
+        city_pool = self._faker_pool("city")
+        street_pool = self._faker_pool("street_name")
+        city = pd.Series(city_pool[rng.integers(0, len(city_pool), count)], dtype=object)
+        building_number = rng.integers(1, 301, count).astype(str).astype(object)
+        street = street_pool[rng.integers(0, len(street_pool), count)] + " " + building_number
+        zip_city = zip_code + " " + city.to_numpy()
+        
+        # Look up coordinates, defaulting to Germany's approximate center
+        latitude = city.map(self._city_lat).fillna(51.1657).to_numpy(dtype=float)
+        longitude = city.map(self._city_lon).fillna(10.4515).to_numpy(dtype=float)
+        
+        # Generate birthday (ages 18-80) as day offsets from the earliest allowed date
+        now = np.datetime64(datetime.now(), "s")
+        today = now.astype("datetime64[D]").astype(date)
+        latest_birthday = _years_before(today, 18)
+        earliest_birthday = _years_before(today, 81) + timedelta(days=1)
+        birthday_offset = rng.integers(
+            0, (latest_birthday - earliest_birthday).days + 1, count
+        ).astype("timedelta64[D]")
+        birthday = np.datetime_as_string(
+            np.datetime64(earliest_birthday, "D") + birthday_offset, unit="D"
+        ).astype(object)
+        
+        # Generate purchase details
+        item = pd.Categorical.from_codes(
+            rng.integers(0, len(self.purchase_items), count), categories=self.purchase_items
+        )
+        price = np.round(rng.uniform(5.0, 199.99, count), 2)
+        quantity = np.where(quantity_u < 0.7, 1, rng.integers(2, 6, count))
+        tax_rate = np.where(tax_u < 0.8, 0.19, 0.07)
+        purchase_type = pd.Categorical.from_codes(
+            rng.integers(0, len(self.purchase_types), count), categories=self.purchase_types
+        )
+        
+        # Generate purchase date as second offsets from the start of this year
+        year_start = now.astype("datetime64[Y]").astype("datetime64[s]")
+        seconds_this_year = max(int((now - year_start) / np.timedelta64(1, "s")), 1)
+        purchase_offset = rng.integers(0, seconds_this_year, count).astype("timedelta64[s]")
+        purchase_date = np.datetime_as_string(year_start + purchase_offset, unit="s").astype("<U19")
+        # ISO strings are fixed width, so replace the 'T' separator in place
+        purchase_date.view("<U1").reshape(-1, 19)[:, 10] = " "
+        purchase_date = purchase_date.astype(object)
+        
+        # Calculate totals
+        subtotal, tax_amount, total = calculate_purchase_totals(price, quantity, tax_rate)
+        
+        return pd.DataFrame({
+            "first_name": first_name,
+            "last_name": last_name,
+            "gender": gender,
+            "email": email,
+            "birthday": birthday,
+            "street": street,
+            "zip_city": zip_city,
+            "state": state,
+            "latitude": latitude,
+            "longitude": longitude,
+            "purchase_item": item,
+            "price": price,
+            "quantity": quantity,
+            "tax_rate": tax_rate,
+            "tax_amount": tax_amount,
+            "subtotal": subtotal,
+            "total": total,
+            "purchase_type": purchase_type,
+            "purchase_date": purchase_date
+        }, copy=False)
 
-def generate_purchase_type(self) -> str:
-    """
-    Generate a purchase type (online or in-store).
-    
-    Returns:
-        A string representing the purchase type.
-    """
-    purchase_types = ["Online", "In-Store"]
-    return random.choice(purchase_types)
+    def generate_profiles_parallel(self, count: int = 10, workers: Optional[int] = None) -> pd.DataFrame:
+        """
+        Generate multiple profiles, sharding the work across worker processes.
+        
+        Args:
+            count: Number of profiles to generate.
+            workers: Number of worker processes (default: number of CPUs).
+        
+        Returns:
+            A pandas DataFrame with all profiles.
+        """
+        workers = max(1, min(workers or os.cpu_count() or 1, count))
+        
+        # Split the count into near-equal shards, each with its own seed
+        base, extra = divmod(count, workers)
+        shards = [
+            (base + (1 if i < extra else 0), self.locale, None if self.seed is None else self.seed + i)
+            for i in range(workers)
+        ]
+        
+        # Spawn fresh interpreters; forking is unsafe with Numba's threading layers
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+            frames = list(executor.map(_generate_profiles_worker, shards))
+        
+        return pd.concat(frames, ignore_index=True)
 
-def generate_profile(self) -> Dict:
-    """
-    Generate a complete fictional profile.
-    
-    Returns:
-        A dictionary containing the profile data.
-    """
-    # Generate gender
-    gender = "male" if random.random() < 0.5 else "female"
-    
-    # Generate first name based on gender
-    if gender == "male":
-        first_name = random.choice(self.first_names_male)
-    else:
-        first_name = random.choice(self.first_names_female)
-    
-    # Generate last name
-    last_name = random.choice(self.last_names)
-    
-    # Generate email
-    email = self.generate_email(first_name, last_name)
-    
-    # Generate state and address
-    state = random.choice(self.states)
-    zip_city, street = self.generate_address(state)
-    
-    # Generate birthday
-    birthday = self.generate_birthday()
-    
-    # Generate purchase details
-    item = random.choice(self.purchase_items)
-    price = self.generate_price()
-    quantity = self.generate_stueckzahl()
-    tax_rate = self.generate_sales_tax()
-    purchase_type = self.generate_purchase_type()
-    
-    # Calculate totals
-    subtotal = price * quantity
-    tax_amount = subtotal * tax_rate
-    total = subtotal + tax_amount
-    
-    # Extract city for coordinates
-    city = zip_city.split(" ", 1)[1] if " " in zip_city else "Berlin"
-    lat, lon = self.generate_geo_coordinates(city)
-    
-    # Create profile dictionary
-    profile = {
-        "first_name": first_name,
-        "last_name": last_name,
-        "gender": gender,
-        "email": email,
-        "birthday": birthday,
-        "street": street,
-        "zip_city": zip_city,
-        "state": state,
-        "latitude": lat,
-        "longitude": lon,
-        "purchase_item": item,
-        "price": round(price, 2),
-        "quantity": quantity,
-        "tax_rate": tax_rate,
-        "tax_amount": round(tax_amount, 2),
-        "subtotal": round(subtotal, 2),
-        "total": round(total, 2),
-        "purchase_type": purchase_type,
-        "purchase_date": self.faker.date_time_this_year().strftime("%Y-%m-%d %H:%M:%S")
-    }
-    
-    return profile
+    def generate_stueckzahl(self) -> int:
+        """
+        Generate a random quantity for a purchase.
+        
+        Returns:
+            An integer representing the quantity.
+        """
+        # Most common case: quantity of 1
+        if self.rng.random() < 0.7:
+            return 1
+        else:
+            # Sometimes buy multiple items (2-5)
+            return int(self.rng.integers(2, 6))
 
-def generate_profiles(self, count: int = 10) -> List[Dict]:
-    """
-    Generate multiple profiles.
-    
-    Args:
-        count: Number of profiles to generate.
-    
-    Returns:
-        A list of profile dictionaries.
-    """
-    profiles = []
-    for _ in range(count):
-        profiles.append(self.generate_profile())
-    return profiles
+    def generate_sales_tax(self) -> float:
+        """
+        Generate sales tax rate.
+        
+        Returns:
+            A float representing the tax rate (0.19 or 0.07).
+        """
+        # Standard rate (19%) or reduced rate (7%)
+        return 0.19 if self.rng.random() < 0.8 else 0.07
 
-def create_dataframe(self, profiles: List[Dict]) -> pd.DataFrame:
-    """
-    Create a DataFrame from profiles.
-    
-    Args:
-        profiles: List of profile dictionaries.
-    
-    Returns:
-        A pandas DataFrame with all profiles.
-    """
-    return pd.DataFrame(profiles)
+    def generate_purchase_type(self) -> str:
+        """
+        Generate a purchase type (online or in-store).
+        
+        Returns:
+            A string representing the purchase type.
+        """
+        return self._choice(self.purchase_types)
 
-def save_to_csv(self, df: pd.DataFrame, file_path: str) -> None:
-    """
-    Save the DataFrame to a CSV file.
-    
-    Args:
-        df: DataFrame to save.
-        file_path: Path for the output file.
-    """
-    df.to_csv(file_path, index=False)
-    print(f"Data saved to CSV: {file_path}")
+    def generate_profile(self) -> Profile:
+        """
+        Generate a complete fictional profile.
+        
+        Returns:
+            A Profile containing the profile data.
+        """
+        # Generate gender
+        gender = "male" if self.rng.random() < 0.5 else "female"
+        
+        # Generate first name based on gender
+        if gender == "male":
+            first_name = self._choice(self.first_names_male)
+        else:
+            first_name = self._choice(self.first_names_female)
+        
+        # Generate last name
+        last_name = self._choice(self.last_names)
+        
+        # Generate email
+        email = self.generate_email(first_name, last_name)
+        
+        # Generate state and address
+        state = self._choice(self.states)
+        zip_city, street = self.generate_address(state)
+        
+        # Generate birthday
+        birthday = self.generate_birthday()
+        
+        # Generate purchase details
+        item = self._choice(self.purchase_items)
+        price = self.generate_price()
+        quantity = self.generate_stueckzahl()
+        tax_rate = self.generate_sales_tax()
+        purchase_type = self.generate_purchase_type()
+        
+        # Calculate totals
+        subtotal = price * quantity
+        tax_amount = subtotal * tax_rate
+        total = subtotal + tax_amount
+        
+        # Extract city for coordinates
+        city = zip_city.split(" ", 1)[1] if " " in zip_city else "Berlin"
+        lat, lon = self.generate_geo_coordinates(city)
+        
+        # Create profile
+        return Profile(
+            first_name=first_name,
+            last_name=last_name,
+            gender=gender,
+            email=email,
+            birthday=birthday,
+            street=street,
+            zip_city=zip_city,
+            state=state,
+            latitude=lat,
+            longitude=lon,
+            purchase_item=item,
+            price=round(price, 2),
+            quantity=quantity,
+            tax_rate=tax_rate,
+            tax_amount=round(tax_amount, 2),
+            subtotal=round(subtotal, 2),
+            total=round(total, 2),
+            purchase_type=purchase_type,
+            purchase_date=self.faker.date_time_this_year().strftime("%Y-%m-%d %H:%M:%S")
+        )
 
-def save_to_excel(self, df: pd.DataFrame, file_path: str) -> None:
-    """
-    Save the DataFrame to an Excel file.
-    
-    Args:
-        df: DataFrame to save.
-        file_path: Path for the output file.
-    """
-    if not EXCEL_AVAILABLE:
-        print("Error: openpyxl is not installed. Cannot save to Excel format.")
-        print("Install it with 'pip install openpyxl'")
-        return
-    
-    df.to_excel(file_path, index=False)
-    print(f"Data saved to Excel: {file_path}")
+    def generate_profiles(self, count: int = 10) -> List[Profile]:
+        """
+        Generate multiple profiles.
+        
+        Args:
+            count: Number of profiles to generate.
+        
+        Returns:
+            A list of profiles.
+        """
+        profiles = []
+        for _ in range(count):
+            profiles.append(self.generate_profile())
+        return profiles
 
-def save_to_json(self, profiles: List[Dict], file_path: str) -> None:
-    """
-    Save profiles to a JSON file.
-    
-    Args:
-        profiles: List of profile dictionaries.
-        file_path: Path for the output file.
-    """
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(profiles, f, ensure_ascii=False, indent=2)
-    print(f"Data saved to JSON: {file_path}")
+    def create_dataframe(self, profiles: List[Profile]) -> pd.DataFrame:
+        """
+        Create a DataFrame from profiles.
+        
+        Args:
+            profiles: List of profiles.
+        
+        Returns:
+            A pandas DataFrame with all profiles.
+        """
+        df = pd.DataFrame(profiles, columns=list(Profile._fields))
+        
+        # Store low-cardinality columns as categoricals
+        for column, categories in (
+            ('state', self.states),
+            ('gender', self.genders),
+            ('purchase_item', self.purchase_items),
+            ('purchase_type', self.purchase_types)
+        ):
+            df[column] = pd.Categorical(df[column], categories=categories)
+        return df
 
-def create_map(self, df: pd.DataFrame, file_path: str) -> None:
-    """
-    Create an interactive map with the profile locations.
-    
-    Args:
-        df: DataFrame with profile data.
-        file_path: Path for the output HTML file.
-    """
-    if not FOLIUM_AVAILABLE:
-        print("Error: folium is not installed. Cannot create map.")
-        print("Install it with 'pip install folium'")
-        return
-    
-    # Create map centered on Germany
-    m = folium.Map(location=[51.1657, 10.4515], zoom_start=6)
-    
-    # Add marker cluster
-    marker_cluster = MarkerCluster().add_to(m)
-    
-    # Add markers for each profile
-    for _, row in df.iterrows():
-        popup_html = f"""
-        <b>{row['first_name']} {row['last_name']}</b><br>
-        {row['street']}<br>
-        {row['zip_city']}<br>
-        <b>Purchase:</b> {row['quantity']}x {row['purchase_item']}<br>
-        <b>Total:</b> €{row['total']:.2f}
-        """
-        folium.Marker(
-            location=[row['latitude'], row['longitude']],
-            popup=folium.Popup(popup_html, max_width=300),
-            icon=folium.Icon(color='blue', icon='info-sign')
-        ).add_to(marker_cluster)
-    
-    # Save map to file
-    m.save(file_path)
-    print(f"Map saved to: {file_path}")
+    def save_to_csv(self, df: pd.DataFrame, file_path: str, use_pyarrow: bool = False) -> None:
+        """
+        Save the DataFrame to a CSV file.
+        
+        Args:
+            df: DataFrame to save.
+            file_path: Path for the output file.
+            use_pyarrow: Write with pyarrow's faster writer, which quotes all
+                string fields and the header and omits '.0' on whole floats.
+        """
+        if use_pyarrow and not PYARROW_AVAILABLE:
+            print("Warning: pyarrow is not installed. Falling back to the pandas CSV writer.")
+            print("Install it with 'pip install pyarrow'")
+        
+        if use_pyarrow and PYARROW_AVAILABLE:
+            pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), file_path)
+        else:
+            with open(file_path, 'w', newline='', buffering=1 << 20, encoding='utf-8') as f:
+                df.to_csv(f, index=False, chunksize=CSV_CHUNK_SIZE, lineterminator='\n',
+                          quoting=csv.QUOTE_MINIMAL)
+        print(f"Data saved to CSV: {file_path}")
+
+    def save_to_excel(self, df: pd.DataFrame, file_path: str) -> None:
+        """
+        Save the DataFrame to an Excel file.
+        
+        Args:
+            df: DataFrame to save.
+            file_path: Path for the output file.
+        """
+        if not EXCEL_AVAILABLE and not XLSXWRITER_AVAILABLE:
+            print("Error: openpyxl is not installed. Cannot save to Excel format.")
+            print("Install it with 'pip install openpyxl'")
+            return
+        
+        if len(df) + 1 > EXCEL_MAX_ROWS:
+            print(f"Error: {len(df)} profiles exceed Excel's limit of {EXCEL_MAX_ROWS - 1} rows per sheet.")
+            print("Use CSV or Parquet format for larger datasets.")
+            return
+        
+        # Stream rows to disk instead of holding the whole workbook in memory;
+        # constant_memory mode requires writing strictly row by row
+        if XLSXWRITER_AVAILABLE:
+            with xlsxwriter.Workbook(file_path, {'constant_memory': True, 'strings_to_urls': False}) as workbook:
+                worksheet = workbook.add_worksheet('profiles')
+                worksheet.write_row(0, 0, list(df.columns))
+                for i, row in enumerate(df.itertuples(index=False, name=None), start=1):
+                    # write_row reports errors through its return value instead of raising
+                    if worksheet.write_row(i, 0, row) < 0:
+                        raise ValueError(f"Could not write row {i} to Excel sheet")
+        else:
+            workbook = openpyxl.Workbook(write_only=True)
+            worksheet = workbook.create_sheet('profiles')
+            worksheet.append(list(df.columns))
+            for row in df.itertuples(index=False, name=None):
+                worksheet.append(row)
+            workbook.save(file_path)
+        print(f"Data saved to Excel: {file_path}")
+
+    def save_to_parquet(self, df: pd.DataFrame, file_path: str) -> None:
+        """
+        Save the DataFrame to a Parquet file.
+        
+        Args:
+            df: DataFrame to save.
+            file_path: Path for the output file.
+        """
+        if not PYARROW_AVAILABLE:
+            print("Error: pyarrow is not installed. Cannot save to Parquet format.")
+            print("Install it with 'pip install pyarrow'")
+            return
+        
+        # Dictionary encoding pays off for the low-cardinality columns
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pq.write_table(table, file_path, compression='zstd', use_dictionary=True, row_group_size=64_000)
+        print(f"Data saved to Parquet: {file_path}")
+
+    def _profile_records(self, profiles: List[Profile]) -> List[Dict]:
+        """
+        Convert profiles to dictionaries for JSON serialization.
+        
+        Args:
+            profiles: List of profiles or profile dictionaries.
+        
+        Returns:
+            A list of profile dictionaries.
+        """
+        return [profile._asdict() if isinstance(profile, Profile) else profile for profile in profiles]
+
+    def save_to_json(self, profiles: List[Profile], file_path: str) -> None:
+        """
+        Save profiles to a JSON file.
+        
+        Args:
+            profiles: List of profiles (profile dictionaries are accepted too).
+            file_path: Path for the output file.
+        """
+        profiles = self._profile_records(profiles)
+        if ORJSON_AVAILABLE:
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(profiles, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                json.dump(profiles, f, ensure_ascii=False, indent=2)
+        print(f"Data saved to JSON: {file_path}")
+
+    def save_to_ndjson(self, profiles: List[Profile], file_path: str) -> None:
+        """
+        Save profiles to a newline-delimited JSON file, one profile per line.
+        
+        Args:
+            profiles: List of profiles (profile dictionaries are accepted too).
+            file_path: Path for the output file.
+        """
+        profiles = self._profile_records(profiles)
+        if ORJSON_AVAILABLE:
+            with open(file_path, 'wb') as f:
+                for profile in profiles:
+                    f.write(orjson.dumps(profile, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                for profile in profiles:
+                    f.write(json.dumps(profile, ensure_ascii=False))
+                    f.write('\n')
+        print(f"Data saved to NDJSON: {file_path}")
+
+    def create_map(self, df: pd.DataFrame, file_path: str) -> None:
+        """
+        Create an interactive map with the profile locations.
+        
+        Args:
+            df: DataFrame with profile data.
+            file_path: Path for the output HTML file.
+        """
+        if not FOLIUM_AVAILABLE:
+            print("Error: folium is not installed. Cannot create map.")
+            print("Install it with 'pip install folium'")
+            return
+        
+        # Create map centered on Germany
+        m = folium.Map(location=[51.1657, 10.4515], zoom_start=6)
+        
+        # Add marker cluster
+        marker_cluster = MarkerCluster().add_to(m)
+        
+        # All markers share the same icon
+        shared_icon = folium.Icon(color='blue', icon='info-sign')
+        
+        # Build all popups in one vectorized pass
+        totals = pd.Series(np.char.mod('%.2f', df['total'].to_numpy(dtype=float)), index=df.index)
+        popups = (
+            '<b>' + df['first_name'].astype(str) + ' ' + df['last_name'].astype(str) + '</b><br>'
+            + df['street'].astype(str) + '<br>'
+            + df['zip_city'].astype(str) + '<br>'
+            + '<b>Purchase:</b> ' + df['quantity'].astype(str) + 'x ' + df['purchase_item'].astype(str) + '<br>'
+            + '<b>Total:</b> €' + totals
+        )
+        
+        # Add markers for each profile
+        for lat, lon, popup_html in zip(df['latitude'].to_numpy(), df['longitude'].to_numpy(), popups.to_numpy()):
+            folium.Marker(
+                location=[lat, lon],
+                popup=folium.Popup(popup_html, max_width=300),
+                icon=shared_icon
+            ).add_to(marker_cluster)
+        
+        # Save map to file
+        m.save(file_path)
+        print(f"Map saved to: {file_path}")
 
 
 def main():
@@ -505,7 +1014,7 @@ def main():
                         help="Number of profiles to generate (default: 10)")
     parser.add_argument("-o", "--output", type=str, default="profiles",
                         help="Output file name without extension (default: profiles)")
-    parser.add_argument("-f", "--format", type=str, choices=["csv", "excel", "json", "all"], 
+    parser.add_argument("-f", "--format", type=str, choices=["csv", "excel", "json", "ndjson", "parquet", "all"], 
                         default="csv", help="Output format (default: csv)")
     parser.add_argument("-l", "--locale", type=str, default="de_DE",
                         help="Locale for generating data (default: de_DE)")
@@ -513,6 +1022,10 @@ def main():
                         help="Random seed for reproducibility")
     parser.add_argument("-m", "--map", action="store_true",
                         help="Create an interactive map visualization")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="Generate profiles in parallel with this many worker processes")
+    parser.add_argument("--arrow-csv", action="store_true",
+                        help="Write CSV with pyarrow (faster; quotes all string fields and the header)")
     
     # Parse arguments
     args = parser.parse_args()
@@ -520,22 +1033,38 @@ def main():
     # Initialize generator
     generator = GeoProfileGenerator(locale=args.locale, seed=args.seed)
     
-    # Generate profiles
-    profiles = generator.generate_profiles(args.num)
-    
-    # Create DataFrame
-    df = generator.create_dataframe(profiles)
+    # Generate profiles as a DataFrame
+    if args.workers:
+        df = generator.generate_profiles_parallel(args.num, args.workers)
+    else:
+        df = generator.generate_frame(args.num)
     
     # Save data based on format
     if args.format == "csv" or args.format == "all":
-        generator.save_to_csv(df, f"{args.output}.csv")
+        generator.save_to_csv(df, f"{args.output}.csv", use_pyarrow=args.arrow_csv)
     
     if args.format == "excel" or args.format == "all":
         generator.save_to_excel(df, f"{args.output}.xlsx")
     
+    # Derive record dicts only when a JSON format needs them, and only once
+    if args.format in ("json", "ndjson", "all"):
+        profiles = df.to_dict("records")
+    
     if args.format == "json" or args.format == "all":
         generator.save_to_json(profiles, f"{args.output}.json")
     
+    if args.format == "ndjson" or args.format == "all":
+        generator.save_to_ndjson(profiles, f"{args.output}.ndjson")
+    
+    if args.format == "parquet":
+        generator.save_to_parquet(df, f"{args.output}.parquet")
+    elif args.format == "all":
+        # pyarrow is optional, so only write Parquet when it is available
+        if PYARROW_AVAILABLE:
+            generator.save_to_parquet(df, f"{args.output}.parquet")
+        else:
+            print("Skipping Parquet output (pyarrow is not installed)")
+    
     # Create map if requested
     if args.map:
         generator.create_map(df, f"{args.output}_map.html")